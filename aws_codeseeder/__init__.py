@@ -14,17 +14,15 @@
 
 import logging
 import os
-import shutil
+from importlib.metadata import version as _version
 from typing import MutableSet, Optional
 
-import pkg_resources
-
 from aws_codeseeder.__metadata__ import __description__, __license__, __title__
 from aws_codeseeder._classes import EnvVar, EnvVarType
 
 __all__ = ["EnvVar", "EnvVarType"]
 
-__version__: str = pkg_resources.get_distribution(__title__).version
+__version__: str = _version(__title__)
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -73,28 +71,46 @@ __all__ = [
 ]
 
 
-def create_output_dir(name: str) -> str:
+def create_output_dir(name: str, clean: bool = True) -> str:
     """Helper function for creating or clearing a codeseeder.out output directory
 
     Parameters
     ----------
     name : str
         Name of the directory to create in  the codeseeder.out directory
+    clean : bool, optional
+        Clear any previous contents of the directory. Callers that know the directory is
+        unique/fresh can skip the recursive delete, by default True
 
     Returns
     -------
     str
         Full path of the created directory
     """
+    import shutil
+
     out_dir = os.path.join(os.getcwd(), "codeseeder.out", name)
-    try:
-        shutil.rmtree(out_dir)
-    except FileNotFoundError:
-        pass
+    if clean:
+        try:
+            shutil.rmtree(out_dir)
+        except FileNotFoundError:
+            pass
     os.makedirs(out_dir, exist_ok=True)
     return out_dir
 
 
+_dependency_loggers_silenced: bool = False
+
+
+def _silence_dependency_loggers() -> None:
+    """Force loggers on dependencies to ERROR, once per process"""
+    global _dependency_loggers_silenced
+    if not _dependency_loggers_silenced:
+        for name in ("boto3", "botocore", "s3transfer", "urllib3"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+        _dependency_loggers_silenced = True
+
+
 def get_logger(level: int, format: Optional[str] = None) -> logging.Logger:
     """Helper function set LOG_LEVEL and optional log FORMAT
 
@@ -110,11 +126,6 @@ def get_logger(level: int, format: Optional[str] = None) -> logging.Logger:
         kwargs["format"] = format  # type: ignore
     logging.basicConfig(**kwargs)  # type: ignore
     LOGGER.setLevel(level=level)
-
-    # Force loggers on dependencies to ERROR
-    logging.getLogger("boto3").setLevel(logging.ERROR)
-    logging.getLogger("botocore").setLevel(logging.ERROR)
-    logging.getLogger("s3transfer").setLevel(logging.ERROR)
-    logging.getLogger("urllib3").setLevel(logging.ERROR)
+    _silence_dependency_loggers()
 
     return LOGGER
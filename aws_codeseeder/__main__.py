@@ -19,9 +19,8 @@ import os
 from typing import Optional, Tuple
 
 import click
-from boto3 import Session
 
-from aws_codeseeder import LOGGER, commands
+from aws_codeseeder import LOGGER, _silence_dependency_loggers
 
 DEBUG_LOGGING_FORMAT = "[%(asctime)s][%(filename)-13s:%(lineno)3d] %(message)s"
 DEBUG_LOGGING_FORMAT_REMOTE = "[%(filename)-13s:%(lineno)3d] %(message)s"
@@ -33,10 +32,7 @@ def set_log_level(level: int, format: Optional[str] = None) -> None:
         kwargs["format"] = format  # type: ignore
     logging.basicConfig(**kwargs)  # type: ignore
     LOGGER.setLevel(level)
-    logging.getLogger("boto3").setLevel(logging.ERROR)
-    logging.getLogger("botocore").setLevel(logging.ERROR)
-    logging.getLogger("s3transfer").setLevel(logging.ERROR)
-    logging.getLogger("urllib3").setLevel(logging.ERROR)
+    _silence_dependency_loggers()
 
 
 @click.group()
@@ -126,15 +122,19 @@ def deploy_seedkit(
         set_log_level(level=logging.DEBUG, format=DEBUG_LOGGING_FORMAT)
     else:
         set_log_level(level=logging.INFO, format="%(message)s")
+    from boto3 import Session
+
+    from aws_codeseeder import commands
+
     session = Session(profile_name=profile, region_name=region)
     commands.deploy_seedkit(
         seedkit_name=name,
-        managed_policy_arns=[p for p in policy_arn],
+        managed_policy_arns=list(policy_arn),
         deploy_codeartifact=deploy_codeartifact,
         session=session,
         vpc_id=vpc_id,
-        subnet_ids=[s for s in subnet_id],
-        security_group_ids=[sg for sg in sg_id],
+        subnet_ids=list(subnet_id),
+        security_group_ids=list(sg_id),
     )
 
 
@@ -167,6 +167,10 @@ def destroy_seedkit(name: str, profile: Optional[str], region: Optional[str], de
         set_log_level(level=logging.DEBUG, format=DEBUG_LOGGING_FORMAT)
     else:
         set_log_level(level=logging.INFO, format="%(message)s")
+    from boto3 import Session
+
+    from aws_codeseeder import commands
+
     session = Session(profile_name=profile, region_name=region)
     commands.destroy_seedkit(seedkit_name=name, session=session)
 
@@ -208,8 +212,12 @@ def deploy_modules(
         set_log_level(level=logging.DEBUG, format=DEBUG_LOGGING_FORMAT)
     else:
         set_log_level(level=logging.INFO, format="%(message)s")
+    from boto3 import Session
+
+    from aws_codeseeder import commands
+
     session = Session(profile_name=profile, region_name=region)
-    commands.deploy_modules(seedkit_name=name, python_modules=[m for m in module], session=session)
+    commands.deploy_modules(seedkit_name=name, python_modules=list(module), session=session)
 
 
 ################################################################################
@@ -240,6 +248,8 @@ def execute(args_file: str, debug: bool) -> None:
 
 
 def main() -> int:
+    os.environ.setdefault("AWS_CODESEEDER_CLI_EXECUTING", "Yes")
+    # keep the historically misspelled name set too for anything still reading it
     os.environ.setdefault("AWS_CODESEEDEER_CLI_EXECUTING", "Yes")
 
     cli.add_command(deploy)
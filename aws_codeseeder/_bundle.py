@@ -12,30 +12,144 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import glob
+import functools
+import hashlib
 import json
 import logging
 import os
-import pathlib
+import re
 import shutil
 import zipfile
-from pprint import pformat
-from typing import Any, Dict, List, Optional, Tuple
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
-from aws_codeseeder import BUNDLE_IGNORED_FILE_PATHS, LOGGER, create_output_dir
+from aws_codeseeder import BUNDLE_IGNORED_FILE_PATHS, CLI_ROOT, LOGGER, create_output_dir
+
+RESOURCES_DIR = os.path.join(CLI_ROOT, "resources")
+DOCKER_CREDS_FILENAME = os.path.join(RESOURCES_DIR, "retrieve_docker_creds.py")
+PYPI_MIRROR_FILENAME = os.path.join(RESOURCES_DIR, "pypi_mirror_support.py")
+NPM_MIRROR_FILENAME = os.path.join(RESOURCES_DIR, "npm_mirror_support.py")
+
+
+_ignore_regex: Optional[Tuple[FrozenSet[str], "re.Pattern[str]"]] = None
+
+
+def _get_ignore_regex() -> Optional["re.Pattern[str]"]:
+    # BUNDLE_IGNORED_FILE_PATHS is public and mutable, recompile only when it changes
+    global _ignore_regex
+    words = frozenset(BUNDLE_IGNORED_FILE_PATHS)
+    if not words:
+        return None
+    if _ignore_regex is None or _ignore_regex[0] != words:
+        _ignore_regex = (words, re.compile("|".join(re.escape(w) for w in sorted(words))))
+        _dir_excluded.cache_clear()
+    return _ignore_regex[1]
+
+
+@functools.lru_cache(maxsize=4096)
+def _dir_excluded(dir_path: str) -> bool:
+    ignore_regex = _get_ignore_regex()
+    return ignore_regex is not None and ignore_regex.search(dir_path + os.sep) is not None
 
 
 def _is_valid_image_file(file_path: str) -> bool:
-    return all([word not in file_path for word in BUNDLE_IGNORED_FILE_PATHS])
+    ignore_regex = _get_ignore_regex()
+    if ignore_regex is None:
+        return True
+    # files in the same directory share the directory-level verdict, only the file name
+    # itself still needs a scan
+    dir_path, _, name = file_path.rpartition(os.sep)
+    if _dir_excluded(dir_path):
+        return False
+    return ignore_regex.search(os.sep + name) is None
+
+
+def _is_valid_image_dir(dir_path: str) -> bool:
+    # a directory matching an ignored path segment is pruned entirely, any file beneath it
+    # would match the same segment
+    return _is_valid_image_file(file_path=dir_path + os.sep)
+
+
+def _stage_entry(name: str, path: str, *, is_dir: bool, is_symlink: bool) -> bool:
+    # single predicate shared by generate_dir's staging copy and the cache-key walk: the
+    # two must traverse the identical file set or a cached bundle can go stale; hidden
+    # entries are skipped because the glob-based listing this replaced never matched them
+    if name.startswith("."):
+        return False
+    if is_dir:
+        return not is_symlink and _is_valid_image_dir(dir_path=path)
+    return _is_valid_image_file(file_path=path)
+
+
+def _walk_files(path: str) -> Iterator[str]:
+    dirs_to_scan = deque([path])
+    while dirs_to_scan:
+        with os.scandir(dirs_to_scan.popleft()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if _stage_entry(entry.name, entry.path, is_dir=True, is_symlink=entry.is_symlink()):
+                        dirs_to_scan.append(entry.path)
+                elif entry.is_file() and _stage_entry(
+                    entry.name, entry.path, is_dir=False, is_symlink=entry.is_symlink()
+                ):
+                    yield entry.path
 
 
 def _list_files(path: str) -> List[str]:
-    path = os.path.join(path, "**")
-    return [f for f in glob.iglob(path, recursive=True) if os.path.isfile(f) and _is_valid_image_file(file_path=f)]
+    return list(_walk_files(path))
+
+
+_DEFLATE_CHUNK_SIZE = 64 * 1024
+
+
+def _deflate_file(path: str, arcname: str, compresslevel: int) -> Tuple[zipfile.ZipInfo, bytes]:
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    crc = 0
+    file_size = 0
+    chunks: List[bytes] = []
+    # stream through the compressor so only the compressed output is held in memory,
+    # never the whole uncompressed file
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(_DEFLATE_CHUNK_SIZE)
+            if not data:
+                break
+            crc = zlib.crc32(data, crc)
+            file_size += len(data)
+            chunks.append(compressor.compress(data))
+    chunks.append(compressor.flush())
+    compressed = b"".join(chunks)
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(compressed)
+    return zinfo, compressed
+
+
+def _append_precompressed(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, compressed: bytes) -> None:
+    # mirrors what ZipFile.write does internally after compressing, allowing the deflate
+    # itself to run on worker threads
+    zf._writecheck(zinfo)  # type: ignore[attr-defined]
+    zf._didModify = True  # type: ignore[attr-defined]
+    zinfo.header_offset = zf.fp.tell()  # type: ignore[union-attr]
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    zf.fp.write(zinfo.FileHeader(zip64))  # type: ignore[union-attr]
+    zf.fp.write(compressed)  # type: ignore[union-attr]
+    zf.start_dir = zf.fp.tell()  # type: ignore[union-attr]
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
 
 
 def _make_zipfile(
-    base_name: str, root_dir: str, base_dir: str, dry_run: bool = False, logger: Optional[logging.Logger] = None
+    base_name: str,
+    root_dir: str,
+    base_dir: str,
+    dry_run: bool = False,
+    logger: Optional[logging.Logger] = None,
+    compresslevel: int = 1,
 ) -> str:
     """Create a zip file from all the files under 'root_dir'/'base_dir'. Including 'base_dir' as a folder in the zip.
 
@@ -55,28 +169,47 @@ def _make_zipfile(
     if logger is not None:
         logger.info("creating '%s' and adding '%s' to it", zip_filename, os.path.join(root_dir, base_dir))
 
+    debug_enabled = logger is not None and logger.isEnabledFor(logging.DEBUG)
+    root_prefix = os.path.normpath(root_dir) + os.sep
+
+    def zip_relative_path(path: str) -> str:
+        return path[len(root_prefix) :] if path.startswith(root_prefix) else os.path.relpath(path, root_dir)
+
+    # directory entries are optional in the zip format, extractors recreate them from
+    # the file paths, so only files are collected; the staged tree under root_dir was
+    # already filtered by generate_dir's ignore rules, so no pruning happens here
+    file_entries: List[Tuple[str, str]] = []
+    for dirpath, _, filenames in os.walk(os.path.join(root_dir, base_dir)):
+        for name in filenames:
+            path = os.path.normpath(os.path.join(dirpath, name))
+            if os.path.isfile(path):
+                file_entries.append((path, zip_relative_path(path)))
+
     if not dry_run:
-        with zipfile.ZipFile(zip_filename, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            path = os.path.normpath(os.path.join(root_dir, base_dir))
-            if path != os.curdir:
-                zip_relative_path = os.path.relpath(pathlib.Path(path), pathlib.Path(root_dir))
-                zf.write(path, zip_relative_path)
-                if logger is not None:
-                    logger.debug("adding '%s'", path)
-            for dirpath, dirnames, filenames in os.walk(os.path.join(root_dir, base_dir)):
-                for name in sorted(dirnames):
-                    path = os.path.normpath(os.path.join(dirpath, name))
-                    zip_relative_path = os.path.relpath(pathlib.Path(path), pathlib.Path(root_dir))
-                    zf.write(path, zip_relative_path)
-                    if logger is not None:
-                        logger.debug("adding '%s'", path)
-                for name in filenames:
-                    path = os.path.normpath(os.path.join(dirpath, name))
-                    if os.path.isfile(path):
-                        zip_relative_path = os.path.relpath(pathlib.Path(path), pathlib.Path(root_dir))
-                        zf.write(path, zip_relative_path)
-                        if logger is not None:
-                            logger.debug("adding '%s'", path)
+        with zipfile.ZipFile(
+            zip_filename, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel, allowZip64=True
+        ) as zf:
+            # zlib releases the GIL, so per-file deflate parallelizes across threads while
+            # entries are appended serially in walk order; the window of in-flight futures
+            # is bounded so at most ~2x cpu_count compressed files sit in memory at once
+            workers = os.cpu_count() or 1
+            max_in_flight = 2 * workers
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                in_flight: Deque[Tuple[str, "Future[Tuple[zipfile.ZipInfo, bytes]]"]] = deque()
+
+                def append_oldest() -> None:
+                    path, future = in_flight.popleft()
+                    zinfo, compressed = future.result()
+                    _append_precompressed(zf=zf, zinfo=zinfo, compressed=compressed)
+                    if debug_enabled:
+                        logger.debug("adding '%s'", path)  # type: ignore[union-attr]
+
+                for path, arcname in file_entries:
+                    if len(in_flight) >= max_in_flight:
+                        append_oldest()
+                    in_flight.append((path, executor.submit(_deflate_file, path, arcname, compresslevel)))
+                while in_flight:
+                    append_oldest()
 
     return zip_filename
 
@@ -90,63 +223,127 @@ def generate_dir(out_dir: str, dir: str, name: str) -> str:
     shutil.rmtree(final_dir)
 
     LOGGER.debug("Copying files to %s", final_dir)
-    files: List[str] = _list_files(path=absolute_dir)
-    if len(files) == 0:
+    file_count = 0
+
+    def copy_function(src: str, dst: str) -> str:
+        nonlocal file_count
+        file_count += 1
+        LOGGER.debug("Copying file to %s", dst)
+        return str(shutil.copy(src=src, dst=dst))
+
+    def ignore(src_dir: str, names: List[str]) -> Set[str]:
+        ignored: Set[str] = set()
+        for n in names:
+            path = os.path.join(src_dir, n)
+            if not _stage_entry(n, path, is_dir=os.path.isdir(path), is_symlink=os.path.islink(path)):
+                ignored.add(n)
+        return ignored
+
+    shutil.copytree(src=absolute_dir, dst=final_dir, ignore=ignore, copy_function=copy_function)
+    if file_count == 0:
         raise ValueError(f"{name} ({absolute_dir}) is empty!")
-    for file in files:
-        LOGGER.debug(f"***file={file}")
-        relpath = os.path.relpath(file, absolute_dir)
-        new_file = os.path.join(final_dir, relpath)
-        LOGGER.debug("Copying file to %s", new_file)
-        os.makedirs(os.path.dirname(new_file), exist_ok=True)
-        LOGGER.debug("Copying file to %s", new_file)
-        shutil.copy(src=file, dst=new_file)
 
     return final_dir
 
 
+def _bundle_cache_key(
+    fn_args: Dict[str, Any],
+    dirs: Optional[List[Tuple[str, str]]],
+    files: Optional[List[Tuple[str, str]]],
+    bundle_id: Optional[str],
+    compresslevel: int,
+) -> str:
+    """Digest of everything that determines the bundle's content
+
+    Directory inputs are keyed at the file level (path, mtime, size) so nested changes
+    invalidate the cache; the bundled resource scripts participate the same way.
+    """
+    key = hashlib.blake2b(digest_size=16)
+    key.update(json.dumps(fn_args, sort_keys=True, default=str).encode("utf-8"))
+    key.update(f"{bundle_id}:{compresslevel}".encode("utf-8"))
+    entries: List[Tuple[str, str, int, int]] = []
+    for src_file, name in [
+        (DOCKER_CREDS_FILENAME, "retrieve_docker_creds.py"),
+        (PYPI_MIRROR_FILENAME, "pypi_mirror_support.py"),
+        (NPM_MIRROR_FILENAME, "npm_mirror_support.py"),
+    ] + (files if files is not None else []):
+        stat = os.stat(src_file)
+        entries.append((name, src_file, stat.st_mtime_ns, stat.st_size))
+    if dirs is not None:
+        for dir, name in dirs:
+            for path in _walk_files(os.path.realpath(dir)):
+                stat = os.stat(path)
+                entries.append((name, path, stat.st_mtime_ns, stat.st_size))
+    for entry in sorted(entries):
+        key.update(repr(entry).encode("utf-8"))
+    return key.hexdigest()
+
+
+_BUNDLE_CACHE_MAX_ENTRIES = 10
+
+
+def _prune_bundle_cache(cache_dir: str) -> None:
+    # fn_args participates in the cache key, so every distinct invocation leaves a zip
+    # behind; keep only the most recently used entries
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(".zip")]
+    except FileNotFoundError:
+        return
+    if len(entries) <= _BUNDLE_CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+    for entry in entries[: len(entries) - _BUNDLE_CACHE_MAX_ENTRIES]:
+        LOGGER.debug("pruning cached bundle %s", entry.path)
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
 def generate_bundle(
     fn_args: Dict[str, Any],
     dirs: Optional[List[Tuple[str, str]]] = None,
     files: Optional[List[Tuple[str, str]]] = None,
     bundle_id: Optional[str] = None,
+    compresslevel: int = 1,
 ) -> str:
+    # bit-identical inputs produce bit-identical bundles, reuse the previous zip when
+    # nothing feeding it changed
+    cache_dir = os.path.join(os.getcwd(), "codeseeder.out", "bundle-cache")
+    cached_zip = os.path.join(cache_dir, f"{_bundle_cache_key(fn_args, dirs, files, bundle_id, compresslevel)}.zip")
+    if os.path.isfile(cached_zip):
+        LOGGER.debug("reusing cached bundle %s", cached_zip)
+        # refresh the mtime so pruning evicts least-recently-used entries first
+        os.utime(cached_zip)
+        return cached_zip
+
     bundle_dir = create_output_dir(f"{bundle_id}/bundle") if bundle_id else create_output_dir("bundle")
     remote_dir = os.path.dirname(bundle_dir)
 
     fn_args_file = os.path.join(bundle_dir, "fn_args.json")
     LOGGER.debug("writing fn_ars file %s", fn_args_file)
     with open(fn_args_file, "w") as file:
-        file.write(json.dumps(fn_args))
+        json.dump(fn_args, file, separators=(",", ":"))
 
     # Add the docker login script
-    shutil.copy(
-        src=os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources/retrieve_docker_creds.py"),
-        dst=os.path.join(bundle_dir, "retrieve_docker_creds.py"),
-    )
+    shutil.copy(src=DOCKER_CREDS_FILENAME, dst=os.path.join(bundle_dir, "retrieve_docker_creds.py"))
 
     # Add the pypi credentials suppprt
-    shutil.copy(
-        src=os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources/pypi_mirror_support.py"),
-        dst=os.path.join(bundle_dir, "pypi_mirror_support.py"),
-    )
+    shutil.copy(src=PYPI_MIRROR_FILENAME, dst=os.path.join(bundle_dir, "pypi_mirror_support.py"))
 
     # Add the npm credentials suppprt
-    shutil.copy(
-        src=os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources/npm_mirror_support.py"),
-        dst=os.path.join(bundle_dir, "npm_mirror_support.py"),
-    )
+    shutil.copy(src=NPM_MIRROR_FILENAME, dst=os.path.join(bundle_dir, "npm_mirror_support.py"))
 
-    LOGGER.debug(f"generate_bundle dirs={dirs}")
+    LOGGER.debug("generate_bundle dirs=%s", dirs)
     # Extra Directories
     if dirs is not None:
         for dir, name in dirs:
-            LOGGER.debug(f"***dir={dir}:name={name}")
+            LOGGER.debug("***dir=%s:name=%s", dir, name)
             generate_dir(out_dir=bundle_dir, dir=dir, name=name)
 
     if files is not None:
         for src_file, name in files:
-            LOGGER.debug(f"***file={src_file}:name={name}")
+            LOGGER.debug("***file=%s:name=%s", src_file, name)
             dst_file = os.path.realpath(os.path.join(bundle_dir, name))
             if "/" in name:
                 os.makedirs(os.path.dirname(dst_file), exist_ok=True)
@@ -154,8 +351,11 @@ def generate_bundle(
 
     LOGGER.debug("bundle_dir: %s", bundle_dir)
 
-    files_glob = glob.glob(bundle_dir + "/**", recursive=True)
-    LOGGER.debug("files:\n%s", pformat(files_glob))
-
-    zip_file = _make_zipfile(base_name=bundle_dir, root_dir=remote_dir, base_dir="bundle", logger=LOGGER)
-    return zip_file
+    # _make_zipfile logs each bundled path at DEBUG, no need for a separate listing pass
+    zip_file = _make_zipfile(
+        base_name=bundle_dir, root_dir=remote_dir, base_dir="bundle", logger=LOGGER, compresslevel=compresslevel
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    os.replace(zip_file, cached_zip)
+    _prune_bundle_cache(cache_dir)
+    return cached_zip
@@ -12,48 +12,68 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import copy
+import functools
 import os
 import random
+import re
 import string
-from string import Template
-from typing import Callable, List, Optional, Union
-
-import yaml
-from boto3 import Session
-from cfn_flip import yaml_dumper
-from cfn_tools import load_yaml
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 from aws_codeseeder import CLI_ROOT, LOGGER, create_output_dir
 from aws_codeseeder.services import get_region, get_sts_info
 
+if TYPE_CHECKING:
+    from boto3 import Session
+
 FILENAME = "template.yaml"
 RESOURCES_FILENAME = os.path.join(CLI_ROOT, "resources", FILENAME)
 
+_PLACEHOLDER_RE = re.compile(r"\$\{\{(\w+)\}\}")
+_ALPHABET = string.ascii_lowercase
 
-def synth(
-    seedkit_name: str,
-    *,
-    deploy_id: Optional[str] = None,
-    managed_policy_arns: Optional[List[str]] = None,
-    deploy_codeartifact: bool = False,
-    session: Optional[Union[Callable[[], Session], Session]] = None,
-    vpc_id: Optional[str] = None,
-    subnet_ids: Optional[List[str]] = None,
-    security_group_ids: Optional[List[str]] = None,
-) -> str:
-    deploy_id = deploy_id if deploy_id else "".join(random.choice(string.ascii_lowercase) for i in range(6))
-    out_dir = create_output_dir(f"seedkit-{deploy_id}")
-    output_filename = os.path.join(out_dir, FILENAME)
+
+@functools.lru_cache(maxsize=1)
+def _get_dumper() -> Any:
+    # cfn_flip is imported lazily, the dumper class is still only built once
+    from cfn_flip import yaml_dumper
+
+    return yaml_dumper.get_dumper()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_template() -> Dict[str, Any]:
+    from cfn_tools import load_yaml
 
     LOGGER.debug("Reading %s", RESOURCES_FILENAME)
     with open(RESOURCES_FILENAME, "r") as file:
-        input_template = load_yaml(file)
+        return load_yaml(file)  # type: ignore[no-any-return]
+
+
+class _SafeFormatDict(Dict[str, str]):
+    """Leaves unknown placeholders untouched, mirroring Template.safe_substitute"""
+
+    def __missing__(self, key: str) -> str:
+        return "${" + key + "}"
+
+
+@functools.lru_cache(maxsize=32)
+def _build_template(
+    managed_policy_arns: Optional[Tuple[str, ...]],
+    deploy_codeartifact: bool,
+    vpc_id: Optional[str],
+    subnet_ids: Optional[Tuple[str, ...]],
+    security_group_ids: Optional[Tuple[str, ...]],
+) -> str:
+    import yaml
+
+    input_template = copy.deepcopy(_load_template())
 
     if managed_policy_arns:
-        input_template["Resources"]["CodeBuildRole"]["Properties"]["ManagedPolicyArns"] += managed_policy_arns
+        input_template["Resources"]["CodeBuildRole"]["Properties"]["ManagedPolicyArns"] += list(managed_policy_arns)
 
     if vpc_id and subnet_ids and security_group_ids:
-        vpcConfig = {"VpcId": vpc_id, "SecurityGroupIds": security_group_ids, "Subnets": subnet_ids}
+        vpcConfig = {"VpcId": vpc_id, "SecurityGroupIds": list(security_group_ids), "Subnets": list(subnet_ids)}
         input_template["Resources"]["CodeBuildProject"]["Properties"]["VpcConfig"] = vpcConfig
 
     if not deploy_codeartifact:
@@ -62,21 +82,49 @@ def synth(
         del input_template["Outputs"]["CodeArtifactDomain"]
         del input_template["Outputs"]["CodeArtifactRepository"]
 
-    output_template = Template(yaml.dump(input_template, Dumper=yaml_dumper.get_dumper()))
+    # pre-convert ${name} placeholders to {name} so substitution is a single C-level
+    # str.format_map pass instead of Template's regex scan
+    dumped = yaml.dump(input_template, Dumper=_get_dumper())
+    return _PLACEHOLDER_RE.sub(r"{\1}", dumped.replace("{", "{{").replace("}", "}}"))
+
+
+def synth(
+    seedkit_name: str,
+    *,
+    deploy_id: Optional[str] = None,
+    managed_policy_arns: Optional[List[str]] = None,
+    deploy_codeartifact: bool = False,
+    session: Optional[Union[Callable[[], "Session"], "Session"]] = None,
+    vpc_id: Optional[str] = None,
+    subnet_ids: Optional[List[str]] = None,
+    security_group_ids: Optional[List[str]] = None,
+) -> str:
+    deploy_id = deploy_id if deploy_id else "".join(random.choices(_ALPHABET, k=6))
+    out_dir = create_output_dir(f"seedkit-{deploy_id}")
+    output_filename = f"{out_dir}{os.sep}{FILENAME}"
+
+    output_template = _build_template(
+        managed_policy_arns=tuple(managed_policy_arns) if managed_policy_arns else None,
+        deploy_codeartifact=deploy_codeartifact,
+        vpc_id=vpc_id,
+        subnet_ids=tuple(subnet_ids) if subnet_ids else None,
+        security_group_ids=tuple(security_group_ids) if security_group_ids else None,
+    )
 
     LOGGER.debug("Writing %s", output_filename)
     os.makedirs(out_dir, exist_ok=True)
     account_id, _, partition = get_sts_info(session=session)
-    with open(output_filename, "w") as file:
-        file.write(
-            output_template.safe_substitute(
-                seedkit_name=seedkit_name,
-                account_id=account_id,
-                region=get_region(session=session),
-                partition=partition,
-                deploy_id=deploy_id,
-                role_prefix="/",
-            )
+    data = output_template.format_map(
+        _SafeFormatDict(
+            seedkit_name=seedkit_name,
+            account_id=account_id,
+            region=get_region(session=session),
+            partition=partition,
+            deploy_id=deploy_id,
+            role_prefix="/",
         )
+    ).encode("utf-8")
+    with open(output_filename, "wb") as file:
+        file.write(data)
 
     return output_filename
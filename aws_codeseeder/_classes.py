@@ -15,12 +15,33 @@
 import dataclasses
 import enum
 import threading
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import boto3
 from mypy_extensions import KwArg, NamedArg, VarArg
 
 
+def _add_slots(cls: type) -> type:
+    """Rebuild a dataclass with ``__slots__`` derived from its fields
+
+    ``@dataclass(slots=True)`` requires Python 3.10+; this is the documented recipe for
+    older interpreters: drop the field defaults from the class dict (they live in
+    ``__init__``) and recreate the class with a ``__slots__`` tuple.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    qualname = getattr(cls, "__qualname__", None)
+    cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        cls.__qualname__ = qualname
+    return cls
+
+
 class ModuleImporterEnum(str, enum.Enum):
     CODESEEDER_CLI = "codeseeder-cli"
     OTHER = "other"
@@ -46,6 +67,10 @@ class SingletonMeta(type):
         Possible changes to the value of the `__init__` argument do not affect
         the returned instance.
         """
+        # double-checked locking: the common already-created path is a plain dict
+        # lookup with no mutex round-trip
+        if cls in cls._instances:
+            return cls._instances[cls]
         with cls._lock:
             if cls not in cls._instances:
                 instance = super().__call__(*args, **kwargs)
@@ -54,17 +79,12 @@ class SingletonMeta(type):
 
 
 class SessionSingleton(metaclass=SingletonMeta):
-    _value: Optional[boto3.Session] = None
-
-    @property
-    def value(self) -> Optional[boto3.Session]:
-        return self._value
-
-    @value.setter
-    def value(self, v: Optional[boto3.Session]) -> None:
-        self._value = v
+    # a plain attribute, the getter/setter property pair added a Python-level call to
+    # every session lookup without enforcing anything
+    value: Optional[boto3.Session] = None
 
 
+@_add_slots
 @dataclasses.dataclass()
 class EnvVar:
     """EnvVar dataclass
@@ -89,7 +109,8 @@ class EnvVar:
     type: EnvVarType = EnvVarType.PLAINTEXT
 
 
-@dataclasses.dataclass()
+@_add_slots
+@dataclasses.dataclass(eq=False, repr=False)
 class CodeSeederConfig:
     """Configuration dataclass
 
@@ -148,29 +169,27 @@ class CodeSeederConfig:
     """
 
     timeout: Optional[int] = 30
-    python_modules: Optional[List[str]] = cast(List[str], dataclasses.field(default_factory=list))
-    pythonpipx_modules: Optional[List[str]] = cast(List[str], dataclasses.field(default_factory=list))
-    local_modules: Optional[Dict[str, str]] = cast(Dict[str, str], dataclasses.field(default_factory=dict))
-    requirements_files: Optional[Dict[str, str]] = cast(Dict[str, str], dataclasses.field(default_factory=dict))
+    python_modules: Optional[List[str]] = dataclasses.field(default_factory=list)
+    pythonpipx_modules: Optional[List[str]] = dataclasses.field(default_factory=list)
+    local_modules: Optional[Dict[str, str]] = dataclasses.field(default_factory=dict)
+    requirements_files: Optional[Dict[str, str]] = dataclasses.field(default_factory=dict)
     codebuild_image: Optional[str] = None
     codebuild_role: Optional[str] = None
     codebuild_environment_type: Optional[str] = None
     codebuild_compute_type: Optional[str] = None
     npm_mirror: Optional[str] = None
     pypi_mirror: Optional[str] = None
-    install_commands: Optional[List[str]] = cast(List[str], dataclasses.field(default_factory=list))
-    pre_build_commands: Optional[List[str]] = cast(List[str], dataclasses.field(default_factory=list))
-    pre_execution_commands: Optional[List[str]] = cast(List[str], dataclasses.field(default_factory=list))
-    build_commands: Optional[List[str]] = cast(List[str], dataclasses.field(default_factory=list))
-    post_build_commands: Optional[List[str]] = cast(List[str], dataclasses.field(default_factory=list))
-    dirs: Optional[Dict[str, str]] = cast(Dict[str, str], dataclasses.field(default_factory=dict))
-    files: Optional[Dict[str, str]] = cast(Dict[str, str], dataclasses.field(default_factory=dict))
-    env_vars: Optional[Dict[str, Union[str, EnvVar]]] = cast(
-        Dict[str, Union[str, EnvVar]], dataclasses.field(default_factory=dict)
-    )
-    exported_env_vars: Optional[List[str]] = cast(List[str], dataclasses.field(default_factory=list))
+    install_commands: Optional[List[str]] = dataclasses.field(default_factory=list)
+    pre_build_commands: Optional[List[str]] = dataclasses.field(default_factory=list)
+    pre_execution_commands: Optional[List[str]] = dataclasses.field(default_factory=list)
+    build_commands: Optional[List[str]] = dataclasses.field(default_factory=list)
+    post_build_commands: Optional[List[str]] = dataclasses.field(default_factory=list)
+    dirs: Optional[Dict[str, str]] = dataclasses.field(default_factory=dict)
+    files: Optional[Dict[str, str]] = dataclasses.field(default_factory=dict)
+    env_vars: Optional[Dict[str, Union[str, EnvVar]]] = dataclasses.field(default_factory=dict)
+    exported_env_vars: Optional[List[str]] = dataclasses.field(default_factory=list)
     abort_phases_on_failure: bool = True
-    runtime_versions: Optional[Dict[str, str]] = cast(Dict[str, str], dataclasses.field(default_factory=dict))
+    runtime_versions: Optional[Dict[str, str]] = dataclasses.field(default_factory=dict)
     prebuilt_bundle: Optional[str] = None
 
 
@@ -181,12 +200,17 @@ ConfigureDecorator = Callable[[ConfigureFn], ConfigureFn]
 RemoteFunctionDecorator = Callable[..., RemoteFunctionFn]
 
 
-@dataclasses.dataclass()
+@_add_slots
+@dataclasses.dataclass(eq=False, repr=False)
 class RegistryEntry:
     configured: bool = False
     config_function: Optional[ConfigureFn] = None
     config_object: CodeSeederConfig = dataclasses.field(default_factory=CodeSeederConfig)
     stack_outputs: Optional[Dict[str, str]] = None
-    remote_functions: Dict[str, RemoteFunctionFn] = dataclasses.field(default_factory=dict)
+    # weak values so the registry does not pin every decorated wrapper for the process
+    # lifetime; entries disappear when the defining module lets go of the function
+    remote_functions: "weakref.WeakValueDictionary[str, RemoteFunctionFn]" = dataclasses.field(
+        default_factory=weakref.WeakValueDictionary
+    )
     deploy_if_not_exists: bool = False
     lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
@@ -12,8 +12,10 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import logging
 import random
 import string
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional, Union
 
@@ -27,9 +29,13 @@ def _print_codebuild_logs(
     events: List[cloudwatch.CloudWatchEvent],
     codebuild_log_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
+    log_debug = LOGGER.debug
     for event in events:
-        msg = event.message[:-1] if event.message.endswith("\n") else event.message
-        LOGGER.debug("[CODEBUILD] %s", msg)
+        msg = event.message
+        if msg.endswith("\n"):
+            # str.removesuffix needs Python 3.9, the package floor is still 3.8
+            msg = msg[:-1]
+        log_debug("[CODEBUILD] %s", msg)
         if codebuild_log_callback:
             codebuild_log_callback(msg)
 
@@ -43,19 +49,32 @@ def _wait_execution(
     start_time: Optional[datetime] = None
     stream_name: Optional[str] = None
     status: Optional[codebuild.BuildInfo] = None
-    for status in codebuild.wait(build_id=build_id, session=session):
-        if status.logs.enabled and status.logs.group_name:
-            if stream_name is None:
-                stream_name = cloudwatch.get_stream_name_by_prefix(
-                    group_name=status.logs.group_name, prefix=f"{stream_name_prefix}/", session=session
-                )
-            if stream_name is not None:
-                events = cloudwatch.get_log_events(
-                    group_name=status.logs.group_name, stream_name=stream_name, start_time=start_time, session=session
-                )
-                _print_codebuild_logs(events=events.events, codebuild_log_callback=codebuild_log_callback)
-                if events.last_timestamp is not None:
-                    start_time = events.last_timestamp + timedelta(milliseconds=1)
+    # a single worker formats/dispatches the previous log batch while the loop moves on
+    # to waiting on the build and fetching the next batch, preserving event order
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        log_future: Optional["Future[None]"] = None
+        for status in codebuild.wait(build_id=build_id, session=session):
+            if status.logs.enabled and status.logs.group_name:
+                if stream_name is None:
+                    stream_name = cloudwatch.get_stream_name_by_prefix(
+                        group_name=status.logs.group_name, prefix=f"{stream_name_prefix}/", session=session
+                    )
+                if stream_name is not None:
+                    events = cloudwatch.get_log_events(
+                        group_name=status.logs.group_name,
+                        stream_name=stream_name,
+                        start_time=start_time,
+                        session=session,
+                    )
+                    if log_future is not None:
+                        log_future.result()
+                    log_future = executor.submit(
+                        _print_codebuild_logs, events=events.events, codebuild_log_callback=codebuild_log_callback
+                    )
+                    if events.last_timestamp is not None:
+                        start_time = events.last_timestamp + timedelta(milliseconds=1)
+        if log_future is not None:
+            log_future.result()
     return status
 
 
@@ -69,9 +88,10 @@ def _execute_codebuild(
     codebuild_log_callback: Optional[Callable[[str], None]] = None,
     session: Optional[Union[Callable[[], Session], Session]] = None,
 ) -> Optional[codebuild.BuildInfo]:
-    LOGGER.debug("bundle_location: %s", bundle_location)
     stream_name_prefix = f"codeseeder-{execution_id}"
-    LOGGER.debug("stream_name_prefix: %s", stream_name_prefix)
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("bundle_location: %s", bundle_location)
+        LOGGER.debug("stream_name_prefix: %s", stream_name_prefix)
     build_id = codebuild.start(
         project_name=stack_outputs["CodeBuildProject"],
         stream_name=stream_name_prefix,
@@ -100,7 +120,7 @@ def run(
     bundle_id: Optional[str] = None,
     prebuilt_bundle: Optional[str] = None,
 ) -> Optional[codebuild.BuildInfo]:
-    execution_id = "".join(random.choice(string.ascii_lowercase) for i in range(8))
+    execution_id = "".join(random.choices(string.ascii_lowercase, k=8))
 
     if prebuilt_bundle:
         prebuilt_bundle = prebuilt_bundle[5:] if prebuilt_bundle.startswith("s3://") else prebuilt_bundle
@@ -113,7 +133,8 @@ def run(
             else f"codeseeder/{execution_id}/bundle.zip"
         )
         bucket = stack_outputs["Bucket"]
-        s3.delete_objects(bucket=bucket, keys=[key], session=session)
+        # the key includes the freshly randomized execution_id and upload_file overwrites,
+        # so no stale object needs clearing before upload
         s3.upload_file(src=bundle_path, bucket=bucket, key=key, session=session)
         loc = f"{bucket}/{key}"
 
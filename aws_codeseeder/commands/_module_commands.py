@@ -15,7 +15,8 @@
 import os
 import shutil
 import subprocess
-from typing import Callable, List, Optional, Union, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Union, cast
 
 from boto3 import Session
 
@@ -80,18 +81,52 @@ def deploy_modules(
         LOGGER.warning("CodeArtifact Repository/Domain was not deployed with the Seedkit")
         return
 
-    if any([":" not in pm for pm in python_modules]):
-        raise ValueError(
-            "Invalid `python_module`. Modules are identified with '[package-name]:[directory]': %s", python_modules
-        )
+    # validate and split in one pass over the list instead of a validation scan
+    # followed by a second split/rebuild
+    modules: Dict[str, str] = {}
+    for python_module in python_modules:
+        module, sep, dir = python_module.partition(":")
+        if not sep:
+            raise ValueError(
+                "Invalid `python_module`. Modules are identified with '[package-name]:[directory]': %s", python_modules
+            )
+        modules[module] = dir
+
+    if not modules:
+        LOGGER.info("No Modules to deploy")
+        return
 
     out_dir = _prep_modules_directory()
-    modules = {ms[0]: ms[1] for ms in [m.split(":") for m in python_modules]}
 
-    for module, dir in modules.items():
+    def stage_module(module: str, dir: str) -> None:
         LOGGER.info("Creating working directory for Module %s", module)
         _bundle.generate_dir(out_dir=out_dir, dir=dir, name=module)
 
-    for module, dir in modules.items():
+    def publish_module(module: str) -> None:
         LOGGER.info("Deploy Module %s to Seedkit Domain/Repository %s/%s", module, domain, repository)
-        subprocess.check_call([os.path.join(out_dir, FILENAME), domain, repository, module, module, profile, region])
+        try:
+            result = subprocess.run(
+                [os.path.join(out_dir, FILENAME), domain, repository, module, module, profile, region],
+                check=True,
+                capture_output=True,
+            )
+        except subprocess.CalledProcessError as e:
+            # the captured output would otherwise be lost with the raised error
+            if e.stdout:
+                LOGGER.error("[%s] %s", module, e.stdout.decode("utf-8", errors="replace"))
+            if e.stderr:
+                LOGGER.error("[%s] %s", module, e.stderr.decode("utf-8", errors="replace"))
+            raise
+        if result.stdout:
+            LOGGER.debug("[%s] %s", module, result.stdout.decode("utf-8", errors="replace"))
+        if result.stderr:
+            LOGGER.debug("[%s] %s", module, result.stderr.decode("utf-8", errors="replace"))
+
+    # modules are independent: each stages into its own out_dir subtree and publishes a
+    # different package, so both phases fan out across a thread pool; output is captured
+    # per-module to keep logs from interleaving
+    with ThreadPoolExecutor(max_workers=min(8, len(modules))) as executor:
+        for future in [executor.submit(stage_module, module, dir) for module, dir in modules.items()]:
+            future.result()
+        for future in [executor.submit(publish_module, module) for module in modules.keys()]:
+            future.result()
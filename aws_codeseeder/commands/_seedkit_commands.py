@@ -106,7 +106,12 @@ def deploy_seedkit(
         security_group_ids=security_group_ids,
     )
     cfn.deploy_template(
-        stack_name=stack_name, filename=template_filename, seedkit_tag=f"codeseeder-{seedkit_name}", session=session
+        stack_name=stack_name,
+        filename=template_filename,
+        seedkit_tag=f"codeseeder-{seedkit_name}",
+        session=session,
+        # existence was just determined above, skip the duplicate DescribeStacks
+        stack_exists=stack_exists,
     )
     LOGGER.info("Seedkit Deployed")
 
@@ -125,6 +130,9 @@ def destroy_seedkit(seedkit_name: str, session: Optional[Union[Callable[[], Sess
     LOGGER.info("Destroying Seedkit %s with Stack Name %s", seedkit_name, stack_name)
     if stack_exists:
         seedkit_bucket = stack_outputs.get("Bucket")
+        # the bucket is a resource of the stack, so it must be emptied and deleted before
+        # stack teardown reaches it - otherwise the resource delete fails with
+        # BucketNotEmpty and the stack lands in DELETE_FAILED
         if seedkit_bucket:
             s3.delete_bucket(bucket=seedkit_bucket, session=session)
         cfn.destroy_stack(stack_name=stack_name, session=session)
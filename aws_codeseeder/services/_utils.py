@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import functools
 import random
 import time
 from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Tuple, Union, overload
@@ -44,6 +45,20 @@ def _get_botocore_config() -> botocore.config.Config:
     )
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_client(service_name: str, session: Optional[boto3.Session]) -> "BaseClient":
+    if session is None:
+        session = boto3.Session()
+    return session.client(service_name=service_name, use_ssl=True, config=_get_botocore_config())  # type: ignore[call-overload,no-any-return]
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_resource(service_name: str, session: Optional[boto3.Session]) -> "ServiceResource":
+    if session is None:
+        session = boto3.Session()
+    return session.resource(service_name=service_name, use_ssl=True, config=_get_botocore_config())  # type: ignore[call-overload,no-any-return]
+
+
 @overload
 def boto3_client(
     service_name: Literal["cloudformation"],
@@ -103,12 +118,14 @@ def boto3_client(
 def boto3_client(
     service_name: str, session: Optional[Union[Callable[[], boto3.Session], boto3.Session]] = None
 ) -> "BaseClient":
-    if session is None:
-        session = _session_singleton.value if _session_singleton.value is not None else boto3.Session()
-    elif callable(session):
+    # clients are memoized per (service, session) so repeated service calls reuse the
+    # botocore client and its pooled HTTPS connections instead of re-handshaking
+    if callable(session):
         session = session()
+    if session is None:
+        session = _session_singleton.value
 
-    return session.client(service_name=service_name, use_ssl=True, config=_get_botocore_config())  # type: ignore[call-overload,no-any-return]
+    return _cached_client(service_name, session)
 
 
 @overload
@@ -135,29 +152,41 @@ def boto3_resource(
 def boto3_resource(
     service_name: str, session: Optional[Union[Callable[[], boto3.Session], boto3.Session]] = None
 ) -> "ServiceResource":
-    if session is None:
-        session = _session_singleton.value if _session_singleton.value is not None else boto3.Session()
-    elif callable(session):
+    if callable(session):
         session = session()
+    if session is None:
+        session = _session_singleton.value
 
-    return session.resource(service_name=service_name, use_ssl=True, config=_get_botocore_config())  # type: ignore[call-overload,no-any-return]
+    return _cached_resource(service_name, session)
 
 
 def set_boto3_session(session: boto3.Session) -> None:
     _session_singleton.value = session
 
 
-def get_region(session: Optional[Union[Callable[[], boto3.Session], boto3.Session]] = None) -> str:
+@functools.lru_cache(maxsize=8)
+def _cached_region(session: Optional[boto3.Session]) -> str:
     if session is None:
-        session = _session_singleton.value if _session_singleton.value is not None else boto3.Session()
-    elif callable(session):
-        session = session()
-
+        session = boto3.Session()
     if session.region_name is None:
         raise ValueError("It is not possible to infer AWS REGION from your environment.")
     return str(session.region_name)
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_sts_info(session: Optional[boto3.Session]) -> Tuple[str, str, str]:
+    sts_info = boto3_client(service_name="sts", session=session).get_caller_identity()
+    return (sts_info["Account"], sts_info["Arn"], sts_info["Arn"].split(":")[1])
+
+
+def get_region(session: Optional[Union[Callable[[], boto3.Session], boto3.Session]] = None) -> str:
+    if callable(session):
+        session = session()
+    if session is None:
+        session = _session_singleton.value
+    return _cached_region(session)
+
+
 def get_sts_info(session: Optional[Union[Callable[[], boto3.Session], boto3.Session]] = None) -> Tuple[str, str, str]:
     """
     get_sts_info _summary_
@@ -172,8 +201,11 @@ def get_sts_info(session: Optional[Union[Callable[[], boto3.Session], boto3.Sess
     Tuple[str, str, str]
         returns the account id, role arn, and aws partition of the session provided
     """
-    sts_info = boto3_client(service_name="sts", session=session).get_caller_identity()
-    return (sts_info["Account"], sts_info["Arn"], sts_info["Arn"].split(":")[1])
+    if callable(session):
+        session = session()
+    if session is None:
+        session = _session_singleton.value
+    return _cached_sts_info(session)
 
 
 def try_it(
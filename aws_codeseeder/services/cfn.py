@@ -13,6 +13,7 @@
 #    limitations under the License.
 
 import datetime as dt
+import functools
 import os
 import time
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union, cast
@@ -58,12 +59,14 @@ def _create_changeset(
     template_path: str = "",
     parameters: Optional[Dict[str, str]] = None,
     session: Optional[Union[Callable[[], Session], Session]] = None,
+    stack_exists: Optional[bool] = None,
 ) -> Tuple[str, str]:
     now: str = dt.datetime.now(tz=dt.timezone.utc).isoformat()
     description = f"Created by AWS CodeSeeder CLI at {now} UTC"
     changeset_name = CHANGESET_PREFIX + str(int(time.time()))
-    stack_exist, _ = does_stack_exist(stack_name=stack_name, session=session)
-    changeset_type = "UPDATE" if stack_exist else "CREATE"
+    if stack_exists is None:
+        stack_exists, _ = does_stack_exist(stack_name=stack_name, session=session)
+    changeset_type = "UPDATE" if stack_exists else "CREATE"
     kwargs: Dict[str, Any] = {
         "ChangeSetName": changeset_name,
         "StackName": stack_name,
@@ -110,6 +113,7 @@ def _wait_for_execute(
     )
 
 
+@functools.lru_cache(maxsize=256)
 def get_stack_name(seedkit_name: str) -> str:
     """Helper function to calculate the name of a CloudFormation Stack for a given Seedkit
 
@@ -197,6 +201,7 @@ def deploy_template(
     s3_bucket: Optional[str] = None,
     parameters: Optional[Dict[str, str]] = None,
     session: Optional[Union[Callable[[], Session], Session]] = None,
+    stack_exists: Optional[bool] = None,
 ) -> None:
     """Deploy a local CloudFormation Template
 
@@ -217,6 +222,9 @@ def deploy_template(
         Key/Value set of Input Parameters to pass to the CloudFormation stack, by default None
     session: Optional[Union[Callable[[], Session], Session]], optional
         Optional Session or function returning a Session to use for all boto3 operations, by default None
+    stack_exists : Optional[bool], optional
+        Whether the Stack is already known to exist; when provided the extra DescribeStacks roundtrip to
+        determine the ChangeSet type is skipped, by default None
 
     Raises
     ------
@@ -245,6 +253,7 @@ def deploy_template(
             seedkit_tag=seedkit_tag,
             template_path=s3_template_path,
             session=session,
+            stack_exists=stack_exists,
         )
     else:
         with open(filename, "r") as handle:
@@ -255,6 +264,7 @@ def deploy_template(
             seedkit_tag=seedkit_tag,
             parameters=parameters,
             session=session,
+            stack_exists=stack_exists,
         )
     has_changes = _wait_for_changeset(changeset_id, stack_name, session=session)
     if has_changes:
@@ -18,21 +18,21 @@ from aws_codeseeder import __main__
 
 
 def test_deploy_seedkit(mocker):
-    mocker.patch("aws_codeseeder.__main__.commands.deploy_seedkit", return_value=None)
+    mocker.patch("aws_codeseeder.commands.deploy_seedkit", return_value=None)
     runner = CliRunner()
     result = runner.invoke(__main__.deploy, ["seedkit", "test", "--debug"])
     assert result.exit_code == 0
 
 
 def test_deploy_modules(mocker):
-    mocker.patch("aws_codeseeder.__main__.commands.deploy_modules", return_value=None)
+    mocker.patch("aws_codeseeder.commands.deploy_modules", return_value=None)
     runner = CliRunner()
     result = runner.invoke(__main__.deploy, ["modules", "test", "--debug"])
     assert result.exit_code == 0
 
 
 def test_destroy_seedkit(mocker):
-    mocker.patch("aws_codeseeder.__main__.commands.destroy_seedkit", return_value=None)
+    mocker.patch("aws_codeseeder.commands.destroy_seedkit", return_value=None)
     runner = CliRunner()
     result = runner.invoke(__main__.destroy, ["seedkit", "test", "--debug"])
     assert result.exit_code == 0
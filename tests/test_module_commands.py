@@ -45,5 +45,8 @@ def test_deploy_modules(mocker):
         return_value=(True, "", {"CodeArtifactDomain": "domain", "CodeArtifactRepository": "repository"}),
     )
     mocker.patch("aws_codeseeder.commands._module_commands._bundle.generate_dir", return_value=None)
-    mocker.patch("aws_codeseeder.commands._module_commands.subprocess.check_call", return_value=None)
+    mocker.patch(
+        "aws_codeseeder.commands._module_commands.subprocess.run",
+        return_value=mocker.Mock(stdout=b"published", stderr=b""),
+    )
     _module_commands.deploy_modules(seedkit_name="test-seedkit", python_modules=["module:module-dir"])